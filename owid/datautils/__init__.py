@@ -1,3 +1,23 @@
 """Library to support the work of the Data Team at Our World in Data."""
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from owid.datautils.web import get_base_url
 
 __version__ = "0.5.2"
+
+__all__ = [
+    "get_base_url",
+]
+
+
+def __getattr__(name: str) -> Any:
+    # Import re-exported functions lazily, so that importing any module of the package does not import their
+    # dependencies (e.g. requests, for get_base_url).
+    if name == "get_base_url":
+        from owid.datautils.web import get_base_url
+
+        # Store the function in the module, so that later lookups do not go through __getattr__ again.
+        globals()[name] = get_base_url
+        return get_base_url
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,7 +1,23 @@
 """Common objects shared by other modules."""
 
 import warnings
-from typing import Any, List, Set, Union
+from typing import Any, List, Optional, Set, Union
+
+import pandas as pd
+
+
+def _get_excel_read_engine() -> Optional[str]:
+    # Use the (much faster) calamine engine to read Excel files, if it is installed and supported by pandas.
+    try:
+        import python_calamine  # noqa: F401
+    except ImportError:
+        return None
+    pandas_version = tuple(int(part) for part in pd.__version__.split(".")[:2])
+    return "calamine" if pandas_version >= (2, 2) else None
+
+
+# Engine to pass on to pd.read_excel (None to let pandas choose the default engine).
+EXCEL_READ_ENGINE = _get_excel_read_engine()
 
 
 class ExceptionFromDocstring(Exception):
@@ -29,4 +45,4 @@ def warn_on_list_of_entities(
     warnings.warn(warning_message)
     if show_list:
         print(warning_message)
-        print("\n".join(["* " + str(entity) for entity in list_of_entities]))
+        print("\n".join(map("* {}".format, list_of_entities)))
@@ -3,7 +3,6 @@
 
 import functools
 from owid.datautils.web import download_file_from_url
-from owid.datautils.s3 import S3
 import tempfile
 from typing import Callable, Any, Optional
 
@@ -49,7 +48,10 @@ def enable_file_download(path_arg_name: Optional[str] = None) -> Callable[[Any],
                         )  # TODO: Add custom args here
                     # Download file from S3 (need credentials)
                     elif path.startswith(prefixes["s3"]):
-                        S3().download_from_s3(
+                        # Import here, to avoid loading boto3 unless files are downloaded from S3.
+                        from owid.datautils.s3 import _get_s3
+
+                        _get_s3().download_from_s3(
                             path, temp_file.name, quiet=True
                         )  # TODO: Add custom args here
 
@@ -1,6 +1,10 @@
 """Numeric formatting."""
+import functools
 import re
-from typing import Union, Any, Dict, Set
+from typing import Union, Any, Dict, FrozenSet, Pattern, Set
+
+# Any character that is not a digit.
+NON_DIGITS_REGEX = re.compile(r"[^0-9]")
 
 
 class IntegerNumber:
@@ -54,6 +58,7 @@ class IntegerNumberWithSeparators:
         self.number_raw = number_raw
 
     @classmethod
+    @functools.lru_cache(maxsize=None)
     def regex_number_with_separator(cls) -> str:
         """Regex expression for number with separators."""
         accepted_separators_str = "|".join(
@@ -62,6 +67,12 @@ class IntegerNumberWithSeparators:
         regex_number_with_separator: str = rf"\d{{1,3}}({accepted_separators_str})"
         return regex_number_with_separator
 
+    @classmethod
+    @functools.lru_cache(maxsize=None)
+    def _pattern_number_with_separator(cls) -> Pattern[str]:
+        """Compiled regex for number with separators."""
+        return re.compile(cls.regex_number_with_separator())
+
     @classmethod
     def is_valid(cls, number: str) -> bool:
         """Check if given number has valid separators.
@@ -76,7 +87,7 @@ class IntegerNumberWithSeparators:
         bool:
             True if valid syntax.
         """
-        return bool(re.fullmatch(cls.regex_number_with_separator(), number))
+        return bool(cls._pattern_number_with_separator().fullmatch(number))
 
     def clean(self) -> int:
         """Clean number.
@@ -92,7 +103,7 @@ class IntegerNumberWithSeparators:
             If provided number was not correct (e.g. does not contain a separator).
         """
         if self.is_valid(self.number_raw):
-            n = re.sub(r"[^0-9]", "", str(self.number_raw))
+            n = NON_DIGITS_REGEX.sub("", str(self.number_raw))
             return int(n)
         raise ValueError(f"Given number {self.number_raw} is not valid!")
 
@@ -176,9 +187,12 @@ class IntegerNumberWithWords:
         return number_raw.replace(" and ", " ")
 
     @classmethod
+    @functools.lru_cache(maxsize=None)
     def regex_number_verbose(cls) -> str:
         """Build regex for a number with words.
 
+        The regex is built only once (per class), and then reused.
+
         Returns
         -------
         str
@@ -191,19 +205,30 @@ class IntegerNumberWithWords:
         return r"\s?".join(regex)
 
     @classmethod
-    def numeric_words_list(cls) -> Set[str]:
-        """Return list of all numeric words (flattened)."""
-        words = set(
+    @functools.lru_cache(maxsize=None)
+    def _pattern_number_verbose(cls) -> Pattern[str]:
+        """Compiled regex for a number with words."""
+        return re.compile(cls.regex_number_verbose())
+
+    @classmethod
+    @functools.lru_cache(maxsize=None)
+    def _numeric_words(cls) -> FrozenSet[str]:
+        """All numeric words (flattened)."""
+        return frozenset(
             word
             for value in cls.numeric_words.values()
             for word in value["words"]
             if word != ""
         )
-        return words
+
+    @classmethod
+    def numeric_words_list(cls) -> Set[str]:
+        """Return list of all numeric words (flattened)."""
+        return set(cls._numeric_words())
 
     def _match_numeric_words(self) -> Dict[str, Union[str, int]]:
         """Match number with words."""
-        match = re.search(self.regex_number_verbose(), self.number)
+        match = self._pattern_number_verbose().search(self.number)
         if match:
             numbers = match.groupdict(default=0)
             return numbers
@@ -213,10 +238,15 @@ class IntegerNumberWithWords:
     @classmethod
     def _build_IntegerNumber(cls, numbers: Dict[str, Union[str, int]]) -> int:
         """Build number from dictionary."""
-        value = 0
-        for k, v in numbers.items():
-            value += float(v) * cls.numeric_words[k]["factor"]
-        return int(value)
+        # Use integer arithmetic (rather than floats), which is faster and exact for any number of digits.
+        factors = cls._integer_factors()
+        return sum(int(v) * factors[k] for k, v in numbers.items())
+
+    @classmethod
+    @functools.lru_cache(maxsize=None)
+    def _integer_factors(cls) -> Dict[str, int]:
+        """Factor (as an integer) of each numeric word."""
+        return {k: int(v["factor"]) for k, v in cls.numeric_words.items()}
 
     @classmethod
     def is_valid(cls, number: str) -> bool:
@@ -233,7 +263,7 @@ class IntegerNumberWithWords:
             True if number contains numeric valid words.
         """
         # return any(word in number for word in cls.numeric_words_list())
-        return bool(re.fullmatch(cls.regex_number_verbose(), number))
+        return bool(cls._pattern_number_verbose().fullmatch(number))
 
     def clean(self) -> int:
         """Clean number.
@@ -307,5 +337,11 @@ def format_number(number: Union[int, str]) -> int:
     int
         Formatted number.
     """
+    return _format_number(number)
+
+
+# Real data tends to contain the same raw numbers many times, so the result of formatting each of them is cached.
+@functools.lru_cache(maxsize=4096, typed=True)
+def _format_number(number: Union[int, str]) -> int:
     number_ = IntegerNumber(number)
     return number_.clean()
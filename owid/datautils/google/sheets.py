@@ -1,6 +1,7 @@
 """Google Sheet utils."""
 import os
-from typing import Union, Any, Optional
+import time
+from typing import Dict, Tuple, Union, Any, Optional
 from gsheets import Sheets
 from gsheets.models import SpreadSheet, WorkSheet
 
@@ -8,6 +9,11 @@ from owid.datautils.google.config import CLIENT_SECRETS_PATH, CREDENTIALS_PATH
 import pandas as pd
 
 
+# Sheets clients, shared by all GSheetsApi instances that use the same secrets and credentials files (since building a
+# client requires loading the credentials and setting up an HTTP client).
+_SHEETS_CLIENTS: Dict[Tuple[str, str], Sheets] = {}
+
+
 class GSheetsApi:
     """Interface to interact with Google sheets."""
 
@@ -15,19 +21,26 @@ class GSheetsApi:
         self,
         clients_secrets: str = CLIENT_SECRETS_PATH,
         credentials_path: str = CREDENTIALS_PATH,
+        cache_ttl: float = 60,
     ) -> None:
         self.clients_secrets = clients_secrets
         self.credentials_path = credentials_path
+        # Number of seconds during which a fetched spreadsheet is reused (0 to always fetch it again).
+        self.cache_ttl = cache_ttl
         self._init_config_folder()
         self.__sheets = None
+        self._spreadsheets: Dict[str, Tuple[float, SpreadSheet]] = {}
 
     @property
     def sheets(self) -> Sheets:
         """Access or initialize sheets attribute."""
         if self.__sheets is None:
-            self.__sheets = Sheets.from_files(
-                self.clients_secrets, self.credentials_path, no_webserver=True
-            )
+            key = (self.clients_secrets, self.credentials_path)
+            if key not in _SHEETS_CLIENTS:
+                _SHEETS_CLIENTS[key] = Sheets.from_files(
+                    self.clients_secrets, self.credentials_path, no_webserver=True
+                )
+            self.__sheets = _SHEETS_CLIENTS[key]
         return self.__sheets
 
     def _init_config_folder(self) -> None:
@@ -35,6 +48,29 @@ class GSheetsApi:
         if not os.path.isdir(credentials_folder):
             os.makedirs(credentials_folder, exist_ok=True)
 
+    def _get_spreadsheet(self, spreadsheet_id: str) -> SpreadSheet:
+        """Get a spreadsheet, reusing it if it was fetched less than `cache_ttl` seconds ago."""
+        now = time.monotonic()
+        cached = self._spreadsheets.get(spreadsheet_id)
+        if (cached is not None) and (now - cached[0] < self.cache_ttl):
+            return cached[1]
+        ssheet = self.sheets.get(spreadsheet_id)
+        self._spreadsheets[spreadsheet_id] = (now, ssheet)
+        return ssheet
+
+    def invalidate(self, spreadsheet_id: Optional[str] = None) -> None:
+        """Forget previously fetched spreadsheets, so that they are fetched again on the next request.
+
+        Parameters
+        ----------
+        spreadsheet_id : str, optional
+            ID of the spreadsheet to forget. By default, all spreadsheets are forgotten.
+        """
+        if spreadsheet_id is None:
+            self._spreadsheets.clear()
+        else:
+            self._spreadsheets.pop(spreadsheet_id, None)
+
     def get(
         self, spreadsheet_id: str, worksheet_id: Optional[int] = None
     ) -> Union[SpreadSheet, WorkSheet]:
@@ -43,6 +79,8 @@ class GSheetsApi:
         If only `spreadsheet_id` is provided, this will return the entire spreadsheet. Otherwise,
         the specific worksheet will be returned.
 
+        Spreadsheets fetched less than `cache_ttl` seconds ago are reused. Use `invalidate` to fetch them again.
+
         Parameters
         ----------
         spreadsheet_id : str
@@ -55,7 +93,7 @@ class GSheetsApi:
         Spreadsheet or WorkSheet
             SpreadSheet or Worksheet.
         """
-        ssheet = self.sheets.get(spreadsheet_id)
+        ssheet = self._get_spreadsheet(spreadsheet_id)
         if worksheet_id:
             return ssheet.get(worksheet_id)
         return ssheet
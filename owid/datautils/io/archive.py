@@ -1,12 +1,23 @@
 """Input/Output functions for local files."""
 
+import io
+import mmap
+import os
+import threading
 import zipfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 import tarfile
-from typing import Union
+from typing import Any, List, Union
 
 from owid.datautils.decorators import enable_file_download
 
+# Minimum number of members of a zip file to extract them using several threads.
+PARALLEL_EXTRACTION_MIN_MEMBERS = 8
+# Maximum number of threads used to extract members of a zip file (more threads do not help, since disk writes become
+# the bottleneck).
+PARALLEL_EXTRACTION_MAX_WORKERS = 8
+
 
 @enable_file_download(path_arg_name="input_file")
 def decompress_file(
@@ -42,20 +53,106 @@ def _decompress_zip_file(
     overwrite: bool = False,
 ) -> None:
     """Unpack zip file."""
-    zip_file = zipfile.ZipFile(input_file)
-
-    # If the content to be written in output folder already exists, raise an error,
-    # unless 'overwrite' is set to True, in which case the existing file will be overwritten.
-    # Path to new file to be created.
-    new_file = Path(output_folder) / Path(zip_file.namelist()[0])
-    if new_file.exists() and not overwrite:
-        raise FileExistsError(
-            "Output already exists. Either change output_folder or use overwrite=True."
-        )
-
-    # Unzip the file and save it in the local output folder.
-    # Note that, if output_folder path does not exist, the following command will create it.
-    zip_file.extractall(output_folder)
+    with zipfile.ZipFile(input_file) as zip_file:
+        # If the content to be written in output folder already exists, raise an error,
+        # unless 'overwrite' is set to True, in which case the existing file will be overwritten.
+        # Path to new file to be created.
+        new_file = os.path.join(output_folder, zip_file.infolist()[0].filename)
+        if os.path.exists(new_file) and not overwrite:
+            raise FileExistsError(
+                "Output already exists. Either change output_folder or use"
+                " overwrite=True."
+            )
+
+        # Unzip the file and save it in the local output folder.
+        # Note that, if output_folder path does not exist, the following commands will create it.
+        members = zip_file.infolist()
+        if len(members) < PARALLEL_EXTRACTION_MIN_MEMBERS:
+            zip_file.extractall(output_folder)
+        else:
+            # Create folders first, and then extract files in parallel.
+            for member in members:
+                if member.is_dir():
+                    zip_file.extract(member, output_folder)
+            _extract_zip_members_in_parallel(
+                input_file=input_file,
+                output_folder=output_folder,
+                members=[member for member in members if not member.is_dir()],
+            )
+
+
+class _MemoryMapReader(io.RawIOBase):
+    """Read-only file object over a memory map, with its own position.
+
+    This allows several threads to read the same memory-mapped file at the same time, without copying its content.
+
+    """
+
+    def __init__(self, memory_map: mmap.mmap) -> None:
+        self._memory_map = memory_map
+        self._position = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self._position
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_CUR:
+            offset += self._position
+        elif whence == io.SEEK_END:
+            offset += len(self._memory_map)
+        self._position = max(offset, 0)
+        return self._position
+
+    def readinto(self, buffer: Any) -> int:
+        data = self._memory_map[self._position : self._position + len(buffer)]
+        buffer[: len(data)] = data
+        self._position += len(data)
+        return len(data)
+
+
+def _extract_zip_members_in_parallel(
+    input_file: Union[str, Path],
+    output_folder: Union[str, Path],
+    members: List[zipfile.ZipInfo],
+) -> None:
+    """Extract members of a zip file using a pool of threads.
+
+    Decompressing and writing files release the GIL, so members are effectively extracted in parallel.
+    The zip file is mapped into memory once, and shared by all threads.
+
+    """
+    thread_data = threading.local()
+    zip_files: List[zipfile.ZipFile] = []
+
+    def _extract_member(member: zipfile.ZipInfo) -> None:
+        # ZipFile objects should not be shared between threads, so each thread reads the memory map on its own.
+        if not hasattr(thread_data, "zip_file"):
+            thread_data.zip_file = zipfile.ZipFile(_MemoryMapReader(memory_map))
+            zip_files.append(thread_data.zip_file)
+        try:
+            thread_data.zip_file.extract(member, output_folder)
+        except FileExistsError:
+            # Another thread created the folder of this member in the meantime.
+            thread_data.zip_file.extract(member, output_folder)
+
+    with open(input_file, "rb") as _input_file, mmap.mmap(
+        _input_file.fileno(), 0, access=mmap.ACCESS_READ
+    ) as memory_map:
+        try:
+            with ThreadPoolExecutor(
+                max_workers=min(PARALLEL_EXTRACTION_MAX_WORKERS, os.cpu_count() or 1)
+            ) as executor:
+                # Consume all results, to raise any error that occurred while extracting.
+                list(executor.map(_extract_member, members))
+        finally:
+            for zip_file in zip_files:
+                zip_file.close()
 
 
 def _decompress_tar_file(
@@ -1,28 +1,51 @@
 """Input/Output functions for local files."""
 
+import functools
 import json
+import mmap
+import os
 from pathlib import Path
-from typing import Any, Hashable, List, Tuple, Union
+from typing import Any, Hashable, Iterator, List, Tuple, Union
 
 from owid.datautils.common import warn_on_list_of_entities
 from owid.datautils.decorators import enable_file_download
 
+try:
+    # Optional dependency, with a much faster json parser.
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore
+
+
+def _load_json_with_orjson(json_file: Union[str, Path]) -> Any:
+    with open(json_file, "rb") as _json_file:
+        if os.fstat(_json_file.fileno()).st_size == 0:
+            # Empty files cannot be mapped into memory (and are not valid json either).
+            return json.loads(b"")
+        # Map the file into memory, so that orjson parses it without first copying its content.
+        with mmap.mmap(_json_file.fileno(), 0, access=mmap.ACCESS_READ) as json_map:
+            json_content = memoryview(json_map)
+            try:
+                return orjson.loads(json_content)
+            except orjson.JSONDecodeError:
+                # Unlike json, orjson does not accept some non-standard values (e.g. NaN).
+                return json.loads(json_content.tobytes())
+            finally:
+                json_content.release()
+
 
 def _load_json_data_and_duplicated_keys(
-    ordered_pairs: List[Tuple[Hashable, Any]]
+    ordered_pairs: List[Tuple[Hashable, Any]], duplicated_keys: List[Hashable]
 ) -> Any:
-    clean_dict = {}
-    duplicated_keys = []
-    for key, value in ordered_pairs:
-        if key in clean_dict:
-            duplicated_keys.append(key)
-        clean_dict[key] = value
-    if len(duplicated_keys) > 0:
-        warn_on_list_of_entities(
-            list_of_entities=duplicated_keys,
-            warning_message="Duplicated entities found.",
-            show_list=True,
-        )
+    # Build the dictionary in one go, and only look for duplicated keys if some keys were lost in the process.
+    # Duplicated keys are only collected here; the warning is raised once the whole file has been parsed.
+    clean_dict = dict(ordered_pairs)
+    if len(clean_dict) < len(ordered_pairs):
+        seen_keys = set()
+        for key, _ in ordered_pairs:
+            if key in seen_keys:
+                duplicated_keys.append(key)
+            seen_keys.add(key)
 
     return clean_dict
 
@@ -34,6 +57,9 @@ def load_json(json_file: Union[str, Path], warn_on_duplicated_keys: bool = True)
     If json file contains duplicated keys, a warning is optionally raised, and only the value of the latest duplicated
     key is kept.
 
+    If orjson is installed, it is used to parse files when warn_on_duplicated_keys is False (since orjson silently
+    discards duplicated keys, the standard json parser is needed to detect them).
+
     Parameters
     ----------
     json_file : Path or str
@@ -47,18 +73,61 @@ def load_json(json_file: Union[str, Path], warn_on_duplicated_keys: bool = True)
         Data loaded from json file.
 
     """
-    with open(json_file, "r") as _json_file:
-        json_content = _json_file.read()
-        if warn_on_duplicated_keys:
+    if warn_on_duplicated_keys:
+        duplicated_keys: List[Hashable] = []
+        with open(json_file, "r") as _json_file:
             data = json.loads(
-                json_content, object_pairs_hook=_load_json_data_and_duplicated_keys
+                _json_file.read(),
+                object_pairs_hook=functools.partial(
+                    _load_json_data_and_duplicated_keys,
+                    duplicated_keys=duplicated_keys,
+                ),
             )
-        else:
-            data = json.loads(json_content)
+        if len(duplicated_keys) > 0:
+            warn_on_list_of_entities(
+                list_of_entities=duplicated_keys,
+                warning_message=f"Duplicated entities found ({len(duplicated_keys)} duplicated keys).",
+                show_list=True,
+            )
+    elif orjson is not None:
+        data = _load_json_with_orjson(json_file)
+    else:
+        with open(json_file, "r") as _json_file:
+            data = json.loads(_json_file.read())
 
     return data
 
 
+def iter_json_records(json_file: Union[str, Path]) -> Iterator[Any]:
+    """Iterate over the records of a json lines file (with one json document per line).
+
+    Unlike load_json, only one record at a time is loaded in memory, which makes it suitable for very large files.
+
+    Parameters
+    ----------
+    json_file : Path or str
+        Path to local json lines file.
+
+    Yields
+    ------
+    record : Any
+        Data loaded from each (non-empty) line of the file.
+
+    """
+    with open(json_file, "rb") as _json_file:
+        for line in _json_file:
+            if not line.strip():
+                continue
+            if orjson is not None:
+                try:
+                    yield orjson.loads(line)
+                    continue
+                except orjson.JSONDecodeError:
+                    # Unlike json, orjson does not accept some non-standard values (e.g. NaN).
+                    pass
+            yield json.loads(line)
+
+
 def save_json(data: Any, json_file: Union[str, Path], **kwargs: Any) -> None:
     """Save data to a json file.
 
@@ -1,23 +1,30 @@
 """S3 utils."""
 
+import functools
+import io
 import os
 import json
-import tempfile
+import re
 from os import path
-from typing import Union, Tuple, Any, List
+from typing import Union, Tuple, Any, List, FrozenSet
 from mypy_boto3_s3 import S3Client
 
 import pandas as pd
 import boto3
-from urllib.parse import urlparse
+from urllib.parse import urlsplit
 from botocore.exceptions import ClientError
 import structlog
 
+from owid.datautils.common import EXCEL_READ_ENGINE
+from owid.datautils.io.df import OUTPUT_DEFAULT_KWARGS
+
 logger = structlog.get_logger()
 
 S3_OBJECT = Union[dict, str, pd.DataFrame]
 
 AWS_PROFILE = os.environ.get("AWS_PROFILE", "default")
+# Section headers (e.g. "[default]") in the AWS config file.
+AWS_PROFILE_REGEX = re.compile(r"^\s*\[([^\]]+)\]", re.MULTILINE)
 
 
 class S3:
@@ -169,7 +176,9 @@ class S3:
             Object to upload to S3. Currently:
                 - dict -> JSON
                 - str -> text
-                - DataFrame -> CSV/XLSX/XLS/ZIP depending on `s3_path` value.
+                - DataFrame -> CSV/XLSX/XLS/ZIP/PARQUET/FEATHER depending on `s3_path` value.
+                  Parquet (compressed with zstd by default) and Feather are much faster to write and read, and
+                  much smaller, than CSV or Excel, so they are recommended for large dataframes.
         s3_path : srt
             Object S3 file destination.
         public : bool, optional)
@@ -180,31 +189,32 @@ class S3:
         ValueError
             If file format is not supported.
         """
-        with tempfile.TemporaryDirectory() as tmpdir:
-            output_path = os.path.join(tmpdir, "file")
-            if isinstance(obj, dict):
-                with open(output_path, "w") as f:
-                    json.dump(obj, f)
-            elif isinstance(obj, str):
-                with open(output_path, "w") as f:
-                    f.write(obj)
-            elif isinstance(obj, pd.DataFrame):
-                if s3_path.endswith(".csv") or s3_path.endswith(".zip"):
-                    obj.to_csv(output_path, index=False, **kwargs)
-                elif s3_path.endswith(".xls") or s3_path.endswith(".xlsx"):
-                    obj.to_excel(
-                        output_path, index=False, engine="xlsxwriter", **kwargs
-                    )
-                else:
-                    raise ValueError(
-                        "pd.DataFrame must be exported to either CSV or XLS/XLSX!"
-                    )
+        # Serialize the object in memory, to avoid writing (and reading back) a temporary file.
+        buffer = io.BytesIO()
+        if isinstance(obj, dict):
+            buffer.write(json.dumps(obj).encode())
+        elif isinstance(obj, str):
+            buffer.write(obj.encode())
+        elif isinstance(obj, pd.DataFrame):
+            if s3_path.endswith(".csv") or s3_path.endswith(".zip"):
+                obj.to_csv(buffer, index=False, **kwargs)
+            elif s3_path.endswith(".xls") or s3_path.endswith(".xlsx"):
+                obj.to_excel(buffer, index=False, engine="xlsxwriter", **kwargs)
+            elif s3_path.endswith(".parquet"):
+                obj.to_parquet(buffer, **{**OUTPUT_DEFAULT_KWARGS["parquet"], **kwargs})
+            elif s3_path.endswith(".feather"):
+                obj.to_feather(buffer, **kwargs)
             else:
                 raise ValueError(
-                    f"Type of `obj` is not supported ({type(obj).__name__}). Supported"
-                    " are json, str and pd.DataFrame"
+                    "pd.DataFrame must be exported to either CSV, XLS/XLSX, Parquet or Feather!"
                 )
-            self.upload_to_s3(local_path=output_path, s3_path=s3_path, public=public)
+        else:
+            raise ValueError(
+                f"Type of `obj` is not supported ({type(obj).__name__}). Supported"
+                " are json, str and pd.DataFrame"
+            )
+        buffer.seek(0)
+        self._upload_fileobj(fileobj=buffer, s3_path=s3_path, public=public)
 
     def obj_from_s3(self, s3_path: str, **kwargs: Any) -> S3_OBJECT:
         """Load object from s3 location.
@@ -217,21 +227,54 @@ class S3:
         Returns
         -------
         object
-            File loaded as object. Currently JSON -> dict, CSV/XLS/XLSV -> pd.DataFrame, general -> str
+            File loaded as object. Currently JSON -> dict, CSV/XLS/XLSX/XLSB/PARQUET/FEATHER -> pd.DataFrame,
+            general -> str. Excel files are read with the calamine engine, if python-calamine is installed.
         """
-        with tempfile.TemporaryDirectory() as tmpdir:
-            output_path = os.path.join(tmpdir, "file")
-            self.download_from_s3(s3_path=s3_path, local_path=output_path)
-            if s3_path.endswith(".json"):
-                with open(output_path, "r") as f:
-                    return json.load(f)  # type: ignore
-            elif s3_path.endswith(".csv"):
-                return pd.read_csv(output_path, **kwargs)  # type: ignore
-            elif s3_path.endswith(".xls") or s3_path.endswith(".xlsx"):
-                return pd.read_excel(output_path, **kwargs)  # type: ignore
-            else:
-                with open(output_path, "r") as f:
-                    return f.read()
+        buffer = self._download_fileobj(s3_path=s3_path)
+        if s3_path.endswith(".json"):
+            return json.load(buffer)  # type: ignore
+        elif s3_path.endswith(".csv"):
+            return pd.read_csv(buffer, **kwargs)  # type: ignore
+        elif s3_path.endswith((".xls", ".xlsx", ".xlsb")):
+            if EXCEL_READ_ENGINE is not None:
+                kwargs = {"engine": EXCEL_READ_ENGINE, **kwargs}
+            elif s3_path.endswith(".xlsb"):
+                kwargs = {"engine": "pyxlsb", **kwargs}
+            return pd.read_excel(buffer, **kwargs)  # type: ignore
+        elif s3_path.endswith(".parquet"):
+            return pd.read_parquet(buffer, **kwargs)
+        elif s3_path.endswith(".feather"):
+            return pd.read_feather(buffer, **kwargs)
+        else:
+            return buffer.getvalue().decode()
+
+    def _upload_fileobj(self, fileobj: io.BytesIO, s3_path: str, public: bool) -> None:
+        # Equivalent to upload_to_s3, but for an in-memory file.
+        logger.info("Uploading to S3…")
+        bucket_name, s3_file = s3_path_to_bucket_key(s3_path)
+        extra_args = {"ACL": "public-read"} if public else {}
+        try:
+            self.client.upload_fileobj(
+                fileobj, bucket_name, s3_file, ExtraArgs=extra_args
+            )
+        except ClientError as e:
+            logger.error(e)
+            raise UploadError(e)
+        logger.info("UPLOADED", s3_path=s3_path)
+
+    def _download_fileobj(self, s3_path: str) -> io.BytesIO:
+        # Equivalent to download_from_s3, but returning an in-memory file.
+        logger.info("Downloading from S3…")
+        bucket_name, s3_file = s3_path_to_bucket_key(s3_path)
+        fileobj = io.BytesIO()
+        try:
+            self.client.download_fileobj(bucket_name, s3_file, fileobj)
+        except ClientError as e:
+            logger.error(e)
+            raise DownloadError(e)
+        logger.info("DOWNLOADED", s3_path=s3_path)
+        fileobj.seek(0)
+        return fileobj
 
     def get_metadata(self, s3_path: str) -> Any:
         """Get metadata from file `s3_path`.
@@ -252,7 +295,7 @@ class S3:
 
 def s3_path_to_bucket_key(url: str) -> Tuple[str, str]:
     """Get bucket and key from either s3:// URL or https:// URL."""
-    parsed = urlparse(url)
+    parsed = urlsplit(url)
     bucket = parsed.netloc
     key = parsed.path.lstrip("/")
 
@@ -269,8 +312,10 @@ def check_for_aws_profile(profile_name: str) -> None:
     You should have the credentials file at ~/.aws/config.
     """
     filename = path.expanduser("~/.aws/config")
-    if not path.exists(filename) or f"[{profile_name}]" not in open(filename).read():
-        raise FileExistsError(
+    if not path.exists(filename) or profile_name not in _read_aws_profiles(
+        filename, os.stat(filename).st_mtime_ns
+    ):
+        raise ConfigurationError(
             f"""you must set up a config file at ~/.aws/config
 it should look like:
 
@@ -283,17 +328,30 @@ aws_secret_access_key = ...
     return
 
 
+@functools.lru_cache(maxsize=None)
+def _read_aws_profiles(filename: str, mtime_ns: int) -> FrozenSet[str]:
+    # Profiles are cached by modification time, so that the file is only read again if it changes.
+    with open(filename) as f:
+        return frozenset(AWS_PROFILE_REGEX.findall(f.read()))
+
+
+@functools.lru_cache(maxsize=None)
+def _get_s3(profile_name: str = AWS_PROFILE) -> S3:
+    # Creating a connection is expensive, so a single S3 object is created (and reused) for each profile.
+    return S3(profile_name)
+
+
 def obj_to_s3(
     data: S3_OBJECT, s3_path: str, public: bool = False, **kwargs: Any
 ) -> None:
     """See S3.obj_to_s3."""
-    s3 = S3()
+    s3 = _get_s3()
     return s3.obj_to_s3(data, s3_path, public, **kwargs)
 
 
 def obj_from_s3(s3_path: str, **kwargs: Any) -> S3_OBJECT:
     """See S3.obj_from_s3."""
-    s3 = S3()
+    s3 = _get_s3()
     return s3.obj_from_s3(s3_path, **kwargs)
 
 
@@ -307,3 +365,9 @@ class DownloadError(Exception):
     """Download error."""
 
     pass
+
+
+class ConfigurationError(FileExistsError):
+    """AWS configuration error."""
+
+    pass
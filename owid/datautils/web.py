@@ -1,15 +1,43 @@
 """Web utils."""
 
+import functools
 import re
+import sys
 import warnings
-from urllib.parse import urlparse
+from typing import TYPE_CHECKING, Iterable, List, Set, Tuple, Union, overload
 
 import requests
 from requests.adapters import HTTPAdapter
 from requests.packages.urllib3.util.ssl_ import create_urllib3_context
 
+if TYPE_CHECKING:
+    # Only needed for type hints; avoid importing pandas when this module is loaded.
+    import pandas as pd
 
-def get_base_url(url: str, include_scheme: bool = True) -> str:
+# Schemes that a url is expected to start with.
+URL_SCHEME_NAMES = ("http", "https")
+# Optional scheme and base url (netloc) at the beginning of a url.
+URL_SCHEME_AND_NETLOC_REGEX = re.compile(r"^(?:(https?)://)?([^/?#]*)")
+
+
+# Base urls (without scheme) for which a warning has already been raised (only used if dedupe_warnings is True).
+# NOTE: This set is shared by the whole process; use reset_base_url_warnings to empty it.
+_SCHEMELESS_BASE_URLS_WARNED: Set[str] = set()
+
+
+def reset_base_url_warnings() -> None:
+    """Forget the base URLs already warned about by get_base_url (with dedupe_warnings=True).
+
+    Warnings are deduplicated for the whole process, so, in long-running processes, this can be used to make
+    get_base_url warn again about base URLs it has already warned about.
+
+    """
+    _SCHEMELESS_BASE_URLS_WARNED.clear()
+
+
+def get_base_url(
+    url: str, include_scheme: bool = True, dedupe_warnings: bool = False
+) -> str:
     """Get base URL from an arbitrary URL path (e.g. "https://example.com/some/path" -> "https://example.com").
 
     If the given URL does not start with "http(s)://"
@@ -21,6 +49,10 @@ def get_base_url(url: str, include_scheme: bool = True) -> str:
     include_scheme : bool, optional
         True to include "http(s)://" at the beginning of the returned base URL.
         False to hide the "http(s)://" (so that "https://example.com/some/path" -> "example.com").
+    dedupe_warnings : bool, optional
+        True to warn only once about each base URL without scheme (which is convenient when processing many URLs).
+        Base URLs already warned about are remembered for the rest of the process (see reset_base_url_warnings).
+        False to warn every time a URL without scheme is found.
 
     Returns
     -------
@@ -28,22 +60,109 @@ def get_base_url(url: str, include_scheme: bool = True) -> str:
         Base URL.
 
     """
-    # Function urlparse cannot parse a url if it does not start with http(s)://.
-    # If such a url is passed, assume "http://".
-    if not re.match(r"https?://", url):
-        warnings.warn(f"Schema not defined for url {url}; assuming http.")
-        url = f"http://{url}"
-
-    # Parse url, and return the base url either starting with "http(s)://" (if include_scheme is True) or without it.
-    parsed_url = urlparse(url)
-    if include_scheme:
-        base_url = f"{parsed_url.scheme}://{parsed_url.netloc}"
+    has_scheme, scheme, netloc = _split_scheme_and_netloc(url)
+
+    if not has_scheme and not (
+        dedupe_warnings and netloc in _SCHEMELESS_BASE_URLS_WARNED
+    ):
+        warnings.warn(f"URL scheme not defined for {url}; assuming http.", stacklevel=2)
+        if dedupe_warnings:
+            _SCHEMELESS_BASE_URLS_WARNED.add(netloc)
+
+    # Return the base url either starting with "http(s)://" (if include_scheme is True) or without it.
+    if include_scheme and has_scheme and len(url) == len(scheme) + 3 + len(netloc):
+        # The url is already a base url (it has no path, query or fragment), so it can be returned as it is.
+        base_url = url
+    elif include_scheme:
+        base_url = f"{scheme}://{netloc}"
     else:
-        base_url = parsed_url.netloc
+        base_url = netloc
 
     return base_url
 
 
+@functools.lru_cache(maxsize=1024)
+def _split_scheme_and_netloc(url: str) -> Tuple[bool, str, str]:
+    # Return whether the url has scheme, its scheme and its base url (netloc).
+    # Results are cached (since the same urls are often processed many times), so no warnings should be raised here.
+    # The base url (netloc) is everything between "://" and the first "/", "?" or "#".
+    # This is equivalent to URL_SCHEME_AND_NETLOC_REGEX (used by get_base_urls), but faster for a single url.
+    scheme, separator, rest = url.partition("://")
+    # If the url does not start with http(s)://, assume "http://".
+    has_scheme = bool(separator) and scheme in URL_SCHEME_NAMES
+    if not has_scheme:
+        scheme, rest = "http", url
+    netloc = rest.partition("/")[0].partition("?")[0].partition("#")[0]
+
+    return has_scheme, scheme, netloc
+
+
+# NOTE: pd.Series is Any for mypy (pandas has no type stubs), so the overload for iterables has to go first, otherwise
+# mypy would consider it unreachable (and would return Any also for lists).
+@overload
+def get_base_urls(urls: Iterable[str], include_scheme: bool = True) -> List[str]:
+    ...
+
+
+@overload
+def get_base_urls(urls: "pd.Series", include_scheme: bool = True) -> "pd.Series":
+    ...
+
+
+def get_base_urls(
+    urls: Union["pd.Series", Iterable[str]], include_scheme: bool = True
+) -> Union["pd.Series", List[str]]:
+    """Get base URLs from a series (or any other iterable) of arbitrary URL paths.
+
+    This is a batch version of get_base_url, which is much faster than applying get_base_url to each element.
+    If some URLs do not start with "http(s)://", "http://" is assumed, and a single warning is raised.
+
+    Parameters
+    ----------
+    urls : pd.Series or Iterable[str]
+        Input URLs.
+    include_scheme : bool, optional
+        True to include "http(s)://" at the beginning of the returned base URLs.
+        False to hide the "http(s)://" (so that "https://example.com/some/path" -> "example.com").
+
+    Returns
+    -------
+    base_urls : pd.Series or List[str]
+        Base URLs. If the input URLs are a series, a series (with the same index), otherwise a list.
+
+    """
+    base_urls: Union["pd.Series", List[str]]
+    # If pandas has not been imported, urls cannot be a series (and there is no need to import pandas).
+    pandas = sys.modules.get("pandas")
+    if pandas is not None and isinstance(urls, pandas.Series):
+        # Extract schemes and base urls of all elements at once.
+        extracted = urls.str.extract(URL_SCHEME_AND_NETLOC_REGEX)
+        schemes, netlocs = extracted[0], extracted[1]
+        schemeless_urls = urls[schemes.isnull() & urls.notnull()].tolist()
+        if include_scheme:
+            base_urls = schemes.fillna("http") + "://" + netlocs
+        else:
+            base_urls = netlocs
+        base_urls.name = urls.name
+    else:
+        # Split each url (this reuses the cache of get_base_url).
+        base_urls = []
+        schemeless_urls = []
+        for url in urls:
+            has_scheme, scheme, netloc = _split_scheme_and_netloc(url)
+            if not has_scheme:
+                schemeless_urls.append(url)
+            base_urls.append(f"{scheme}://{netloc}" if include_scheme else netloc)
+
+    if len(schemeless_urls) > 0:
+        warnings.warn(
+            f"URL scheme not defined for {len(schemeless_urls)} urls (e.g. {schemeless_urls[0]}); assuming http.",
+            stacklevel=2,
+        )
+
+    return base_urls
+
+
 class _DESAdapter(HTTPAdapter):  # type: ignore
     """A TransportAdapter that re-enables Triple DES support in requests.
 
@@ -0,0 +1,15 @@
+"""Helper functions shared by several test modules.
+
+"""
+
+import pandas as pd
+
+
+def assert_frames_equal_tol(
+    df1: pd.DataFrame, df2: pd.DataFrame, atol: float = 1e-8, rtol: float = 1e-8
+) -> None:
+    # Lighter alternative to asserting dataframes.are_equal(df1, df2)[0], which stops at the first difference
+    # (instead of building a dataframe comparing all elements).
+    pd.testing.assert_frame_equal(
+        df1, df2, check_exact=False, atol=atol, rtol=rtol, check_dtype=True
+    )
@@ -5,6 +5,7 @@ from owid.datautils.format.numbers import (
     num_to_str,
     remove_multiple_whitespaces,
     format_number,
+    _format_number,
 )
 from pytest import raises
 
@@ -60,11 +61,16 @@ class TestIntegerNumberWithWords:
     def test_regex_number_verbose(self):
         regex = IntegerNumberWithWords.regex_number_verbose()
         assert isinstance(regex, str)
+        # The regex is only built once.
+        assert IntegerNumberWithWords.regex_number_verbose() is regex
 
     def test_numeric_words_list(self):
         words = IntegerNumberWithWords.numeric_words_list()
         assert isinstance(words, set)
         assert all([isinstance(word, str) for word in words])
+        # Modifying the returned set does not affect later calls.
+        words.clear()
+        assert len(IntegerNumberWithWords.numeric_words_list()) > 0
 
     def test_match_numeric_words_ok(self):
         numbers = {
@@ -218,3 +224,15 @@ def test_remove_multiple_whitespaces():
 
 def test_format_IntegerNumber():
     assert 100 == format_number("100")
+
+
+def test_format_number_caches_results():
+    assert format_number("1 million 1 hundred") == 1000100
+    hits = _format_number.cache_info().hits
+    assert format_number("1 million 1 hundred") == 1000100
+    assert _format_number.cache_info().hits == hits + 1
+    assert format_number(1000100) == 1000100
+    # Invalid numbers keep raising errors (errors are not cached).
+    for _ in range(2):
+        with raises(ValueError):
+            format_number("not a number")
@@ -1,6 +1,9 @@
+from typing import Any
 from unittest import mock
+from owid.datautils.google import sheets
 from owid.datautils.google.sheets import GSheetsApi
 import pandas as pd
+import pytest
 from gsheets import Sheets
 
 
@@ -13,11 +16,11 @@ class MockSheets:
         return cls()
 
     def get(self, *args, **kwargs):
-        return MockSpreadSheet()  # type: ignore
+        return MockSpreadSheet()
 
 
 class MockSpreadSheet:
-    def __init__(self, *args, **kwargs):
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
         self.name = "spreadsheet"
 
     def get(self, *args, **kwargs):
@@ -38,6 +41,13 @@ class MockWorkSheet:
         return pd.DataFrame()
 
 
+@pytest.fixture(autouse=True)
+def clear_sheets_clients():
+    sheets._SHEETS_CLIENTS.clear()
+    yield
+    sheets._SHEETS_CLIENTS.clear()
+
+
 @mock.patch.object(GSheetsApi, "_init_config_folder", return_value=None)
 class TestGSheetsApi:
     clients_secrets = "a"
@@ -56,6 +66,17 @@ class TestGSheetsApi:
         _ = api.sheets
         assert api.sheets.name == "hello"
 
+    @mock.patch("gsheets.Sheets.from_files", side_effect=MockSheets.from_files)
+    def test_sheets_shared_between_instances(self, mock_from_files, mock_init):
+        api_1 = GSheetsApi(self.clients_secrets, self.credentials_path)
+        api_2 = GSheetsApi(self.clients_secrets, self.credentials_path)
+        assert api_1.sheets is api_2.sheets
+        assert mock_from_files.call_count == 1
+        # Different credentials require a different client.
+        api_3 = GSheetsApi(self.clients_secrets, "c")
+        assert api_3.sheets is not api_1.sheets
+        assert mock_from_files.call_count == 2
+
     @mock.patch("gsheets.Sheets.from_files", side_effect=MockSheets.from_files)
     @mock.patch("gsheets.Sheets.get", side_effect=MockSheets.get)
     def test_get(self, mock_init, mock_sheets_1, mock_sheets_2):
@@ -67,6 +88,25 @@ class TestGSheetsApi:
         ws = api.get(spreadsheet_id=self.ss_id, worksheet_id=self.ws_id)
         assert isinstance(ws, MockWorkSheet)
 
+    @mock.patch("gsheets.Sheets.from_files", side_effect=MockSheets.from_files)
+    def test_get_reuses_spreadsheets(self, mock_from_files, mock_init):
+        api = GSheetsApi(self.clients_secrets, self.credentials_path)
+        with mock.patch.object(
+            MockSheets, "get", return_value=MockSpreadSheet()
+        ) as mock_get:
+            ss_1 = api.get(spreadsheet_id=self.ss_id)
+            ss_2 = api.get(spreadsheet_id=self.ss_id)
+            assert ss_1 is ss_2
+            assert mock_get.call_count == 1
+            # After invalidating, the spreadsheet is fetched again.
+            api.invalidate(self.ss_id)
+            _ = api.get(spreadsheet_id=self.ss_id)
+            assert mock_get.call_count == 2
+            # Without cache, the spreadsheet is always fetched.
+            api.cache_ttl = 0
+            _ = api.get(spreadsheet_id=self.ss_id)
+            assert mock_get.call_count == 3
+
     @mock.patch(
         "owid.datautils.google.sheets.GSheetsApi.get", return_value=MockWorkSheet()  # type: ignore
     )
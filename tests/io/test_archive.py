@@ -19,6 +19,27 @@ class TestDecompressZipFile:
     def test_raise_error_if_file_exists_zip(self, tmp_path):
         _test_raise_error_if_file_exists(tmp_path, ".zip")
 
+    def test_decompress_file_with_many_members_zip(self, tmp_path):
+        # Create a zip file with enough members to be extracted in parallel, some of them within (nested) folders.
+        contents = {
+            f"dir_{i % 3}/sub_dir_{i % 2}/file_{i}.txt": f"Content {i}."
+            for i in range(20)
+        }
+        contents["file.txt"] = "Content."
+        zip_path = tmp_path / "many_files.zip"
+        with zipfile.ZipFile(
+            zip_path, "w", compression=zipfile.ZIP_DEFLATED
+        ) as zip_file:
+            zip_file.writestr("empty_dir/", "")
+            for name, content in contents.items():
+                zip_file.writestr(name, content)
+        # Decompress the file in a new folder, and check that all files are recovered.
+        new_dir = tmp_path / "new_dir"
+        decompress_file(input_file=zip_path, output_folder=new_dir)
+        assert (new_dir / "empty_dir").is_dir()
+        for name, content in contents.items():
+            assert (new_dir / name).read_text() == content
+
 
 class TestDecompressTarGzFile:
     def test_decompress_file_with_content_targz(self, tmp_path):
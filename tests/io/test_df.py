@@ -1,13 +1,16 @@
 """Test functions in owid.datautils.io.local module.
 
 """
+from owid.datautils.io import df as df_module
 from owid.datautils.io.df import from_file, to_file
 from pathlib import Path
 import tempfile
-from typing import Any
+from unittest import mock
+from typing import Any, Dict, List, Tuple
 import pandas as pd
 from pytest import raises
 import numpy as np
+import pyarrow.parquet as pq
 
 
 class TestLoadDf:
@@ -74,11 +77,78 @@ class TestLoadDf:
         df = from_file(str(file), file_type="csv")
         assert df.equals(self.df_original)
 
+    def test_from_file_csv_streamed_compressions(self, tmpdir):
+        for compression in ["gz", "bz2", "xz"]:
+            file = tmpdir / f"test.{compression}"
+            self.df_original.to_csv(file, index=False)
+            with mock.patch.object(
+                df_module, "_PrefetchedReader", wraps=df_module._PrefetchedReader
+            ) as reader_mock:
+                df = from_file(str(file), file_type="csv", engine="c")
+            assert reader_mock.call_count == 1
+            assert df.equals(self.df_original)
+
+    def test_from_file_csv_compressed_in_chunks(self, tmpdir):
+        file = tmpdir / "test.gz"
+        df_original = pd.DataFrame({"a": range(10)})
+        df_original.to_csv(file, index=False)
+        cases: List[Dict[str, Any]] = [{"chunksize": 3}, {"iterator": True}]
+        for kwargs in cases:
+            with from_file(str(file), file_type="csv", **kwargs) as reader:
+                chunks = [reader.get_chunk(3) for _ in range(4)]
+            assert [len(chunk) for chunk in chunks] == [3, 3, 3, 1]
+            assert pd.concat(chunks).equals(df_original)
+
+    def test_prefetched_reader_keeps_raising_errors(self):
+        stream = mock.Mock()
+        stream.read.side_effect = OSError("corrupted file")
+        reader = df_module._PrefetchedReader(stream)
+        buffer = bytearray(10)
+        # Further reads after an error raise it again (instead of waiting forever for the stopped thread).
+        for _ in range(2):
+            with raises(OSError, match="corrupted file"):
+                reader.readinto(buffer)
+        reader.close()
+
+    def test_from_file_csv_keeps_dates_as_strings(self, tmpdir):
+        file = tmpdir / "test.csv"
+        df_original = pd.DataFrame({"date": ["2020-01-01", "2020-01-02"], "a": [1, 2]})
+        df_original.to_csv(file, index=False)
+        for engine in [None, "c", "pyarrow"]:
+            kwargs = {"engine": engine} if engine else {}
+            df = from_file(str(file), **kwargs)
+            if engine == "pyarrow":
+                # When explicitly using pyarrow, dates are parsed.
+                assert not df.equals(df_original)
+            else:
+                assert df.equals(df_original)
+
+    def test_from_file_csv_keeps_pandas_default_types(self, tmpdir):
+        file = tmpdir / "test.csv"
+        file.write_text(",a,b,c\n0,NA,99999999999999999999,x\n", encoding="utf-8")
+        df = from_file(str(file))
+        assert df.equals(pd.read_csv(file))
+        assert df.columns.tolist() == ["Unnamed: 0", "a", "b", "c"]
+        assert df["a"].dtype == float
+        assert df["b"].tolist() == ["99999999999999999999"]
+
+    def test_from_file_excel_uses_excel_read_engine(self, tmpdir):
+        file = tmpdir / "test.xlsx"
+        self.df_original.to_excel(file, index=False)
+        with mock.patch.object(df_module, "EXCEL_READ_ENGINE", "openpyxl"):
+            with mock.patch(
+                "owid.datautils.io.df.pd.read_excel", wraps=pd.read_excel
+            ) as read_excel_mock:
+                df = from_file(str(file))
+        assert read_excel_mock.call_args.kwargs == {"engine": "openpyxl"}
+        assert df.equals(self.df_original)
+
     def test_from_file_filenotfound(self, tmpdir):
         """File does not exist."""
-        with raises(FileNotFoundError):
-            file = tmpdir / "test.csv"
-            _ = from_file(str(file))
+        for extension in ["csv", "parquet", "xlsx", "json", "xml"]:
+            with raises(FileNotFoundError):
+                file = tmpdir / f"test.{extension}"
+                _ = from_file(str(file))
 
     def test_from_file_zip_err(self, tmpdir):
         """Compressed file, but no file type is given."""
@@ -232,6 +302,20 @@ class TestToFile:
             recovered_df = pd.read_parquet(temp_file)
         assert recovered_df.equals(df.reset_index(drop=True))
 
+    def test_save_parquet_file_with_zstd_compression_by_default(self):
+        df = pd.DataFrame({"a": [1, 2, 3], "b": [4, 5, 6]})
+        cases: List[Tuple[Dict[str, Any], str]] = [
+            ({}, "ZSTD"),
+            ({"compression": "gzip"}, "GZIP"),
+        ]
+        with tempfile.TemporaryDirectory() as temp_dir:
+            for kwargs, compression in cases:
+                temp_file = Path(temp_dir) / "test.parquet"
+                to_file(df, file_path=temp_file, **kwargs)
+                metadata = pq.ParquetFile(temp_file).metadata
+                assert metadata.row_group(0).column(0).compression == compression
+                assert pd.read_parquet(temp_file).equals(df)
+
     def test_save_feather_file(self):
         # Multiindex dataframes cannot be stored as feather files.
         # Also, df.to_feather() does not accept an 'index' argument.
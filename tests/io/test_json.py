@@ -2,54 +2,93 @@
 
 """
 
-from pytest import warns
-from unittest.mock import patch, mock_open
+import math
+from pathlib import Path
 
-from owid.datautils.io.json import load_json, save_json
+from pytest import raises, warns
+
+from owid.datautils.io.json import iter_json_records, load_json, save_json
+
+
+def _write_json_file(tmp_path: Path, content: str) -> Path:
+    json_file = tmp_path / "test.json"
+    json_file.write_text(content)
+    return json_file
 
 
 class TestLoadJson:
-    @patch("builtins.open", new_callable=mock_open, read_data='{"1": "10", "2": "20"}')
-    def test_load_json_without_duplicated_keys(self, _):
-        assert load_json(_) == {"1": "10", "2": "20"}
-
-    @patch(
-        "builtins.open",
-        new_callable=mock_open,
-        read_data='{"1": {"1_1": "1", "1_2": "2"}, "2": "20"}',
-    )
-    def test_load_json_without_duplicated_keys_with_more_levels(self, _):
-        assert load_json(_) == {"1": {"1_1": "1", "1_2": "2"}, "2": "20"}
-
-    @patch(
-        "builtins.open",
-        new_callable=mock_open,
-        read_data='[{"1": {"1_1": "1", "1_2": "2"}, "2": "20"}, {"1": "10"}]',
-    )
-    def test_load_json_without_duplicated_keys_with_more_levels_in_a_list(self, _):
+    def test_load_json_without_duplicated_keys(self, tmp_path):
+        json_file = _write_json_file(tmp_path, '{"1": "10", "2": "20"}')
+        assert load_json(json_file) == {"1": "10", "2": "20"}
+
+    def test_load_json_without_duplicated_keys_with_more_levels(self, tmp_path):
+        json_file = _write_json_file(
+            tmp_path, '{"1": {"1_1": "1", "1_2": "2"}, "2": "20"}'
+        )
+        assert load_json(json_file) == {"1": {"1_1": "1", "1_2": "2"}, "2": "20"}
+
+    def test_load_json_without_duplicated_keys_with_more_levels_in_a_list(
+        self, tmp_path
+    ):
+        json_file = _write_json_file(
+            tmp_path, '[{"1": {"1_1": "1", "1_2": "2"}, "2": "20"}, {"1": "10"}]'
+        )
         # Here the key "1" is repeated, however, it is in a different dictionary, so it is not a duplicated key.
-        assert load_json(_) == [{"1": {"1_1": "1", "1_2": "2"}, "2": "20"}, {"1": "10"}]
-
-    @patch(
-        "builtins.open",
-        new_callable=mock_open,
-        read_data='{"1": "10", "2": "20", "1": "100"}',
-    )
-    def test_load_json_with_duplicated_keys_and_no_warning(self, _):
-        assert load_json(_, warn_on_duplicated_keys=False) == {"1": "100", "2": "20"}
-
-    @patch(
-        "builtins.open",
-        new_callable=mock_open,
-        read_data='{"1": "10", "2": "20", "1": "100"}',
-    )
-    def test_warn_on_load_json_with_duplicated_keys_and_warning(self, _):
+        assert load_json(json_file) == [
+            {"1": {"1_1": "1", "1_2": "2"}, "2": "20"},
+            {"1": "10"},
+        ]
+
+    def test_load_json_with_duplicated_keys_and_no_warning(self, tmp_path):
+        json_file = _write_json_file(tmp_path, '{"1": "10", "2": "20", "1": "100"}')
+        assert load_json(json_file, warn_on_duplicated_keys=False) == {
+            "1": "100",
+            "2": "20",
+        }
+
+    def test_warn_on_load_json_with_duplicated_keys_and_warning(self, tmp_path):
+        json_file = _write_json_file(tmp_path, '{"1": "10", "2": "20", "1": "100"}')
         with warns(UserWarning, match="Duplicated"):
-            assert load_json(_, warn_on_duplicated_keys=True) == {"1": "100", "2": "20"}
+            assert load_json(json_file, warn_on_duplicated_keys=True) == {
+                "1": "100",
+                "2": "20",
+            }
+
+    def test_warn_once_on_load_json_with_duplicated_keys_in_nested_dicts(
+        self, tmp_path
+    ):
+        json_file = _write_json_file(
+            tmp_path, '{"a": {"1": "10", "1": "100"}, "b": {"2": "20", "2": "200"}}'
+        )
+        with warns(UserWarning, match="2 duplicated keys") as record:
+            assert load_json(json_file, warn_on_duplicated_keys=True) == {
+                "a": {"1": "100"},
+                "b": {"2": "200"},
+            }
+        assert len(record) == 1
+
+    def test_load_json_with_non_standard_values_and_no_warning(self, tmp_path):
+        json_file = _write_json_file(tmp_path, '{"1": NaN, "2": [Infinity]}')
+        data = load_json(json_file, warn_on_duplicated_keys=False)
+        assert math.isnan(data["1"])
+        assert data["2"] == [math.inf]
+
+    def test_load_empty_json(self, tmp_path):
+        json_file = _write_json_file(tmp_path, "{}")
+        assert load_json(json_file) == {}
+
+    def test_load_empty_file(self, tmp_path):
+        json_file = _write_json_file(tmp_path, "")
+        for warn_on_duplicated_keys in [True, False]:
+            with raises(ValueError):
+                load_json(json_file, warn_on_duplicated_keys=warn_on_duplicated_keys)
+
 
-    @patch("builtins.open", new_callable=mock_open, read_data="{}")
-    def test_load_empty_json(self, _):
-        assert load_json(_) == {}
+def test_iter_json_records(tmp_path):
+    json_file = _write_json_file(tmp_path, '{"1": "10"}\n\n[1, 2]\n"3"\n[Infinity]\n')
+    records = iter_json_records(json_file)
+    assert next(records) == {"1": "10"}
+    assert list(records) == [[1, 2], "3", [math.inf]]
 
 
 def test_save_json(tmpdir):
@@ -1,41 +1,55 @@
 # type: ignore
+import os
 from unittest import mock
 import boto3
+import pandas as pd
+from pytest import fixture, mark, raises
 
 from owid.datautils import s3
 
 
-def test_s3_path_to_bucket_key():
-    url = "https://walden.nyc3.digitaloceanspaces.com/a/test.csv"
-    assert s3.s3_path_to_bucket_key(url) == ("walden", "a/test.csv")
+@fixture
+def s3_mocked():
+    # S3 object with a mocked client (instead of a real connection).
+    with mock.patch.object(s3.S3, "connect") as connect_mock:
+        yield s3.S3(), connect_mock.return_value
 
-    url = "s3://walden/a/test.csv"
-    assert s3.s3_path_to_bucket_key(url) == ("walden", "a/test.csv")
 
-    url = "https://walden.s3.us-west-2.amazonaws.com/a/test.csv"
+@mark.parametrize(
+    "url",
+    [
+        "https://walden.nyc3.digitaloceanspaces.com/a/test.csv",
+        "s3://walden/a/test.csv",
+        "https://walden.s3.us-west-2.amazonaws.com/a/test.csv",
+    ],
+)
+def test_s3_path_to_bucket_key(url):
     assert s3.s3_path_to_bucket_key(url) == ("walden", "a/test.csv")
 
 
-@mock.patch.object(s3.S3, "connect")
-def test_download_from_s3(connect_mock):
-    S3 = s3.S3()
+def test_s3_path_to_bucket_key_with_semicolon_in_key():
+    url = "https://walden.nyc3.digitaloceanspaces.com/a;b/test;v=1.csv"
+    assert s3.s3_path_to_bucket_key(url) == ("walden", "a;b/test;v=1.csv")
+
+
+def test_download_from_s3(s3_mocked):
+    S3, client = s3_mocked
     S3.download_from_s3(
         "https://test_bucket.nyc3.digitaloceanspaces.com/test_bucket/test.csv",
         "test.csv",
     )
-    assert connect_mock.return_value.download_file.call_args_list[0].args == (
+    assert client.download_file.call_args_list[0].args == (
         "test_bucket",
         "test_bucket/test.csv",
         "test.csv",
     )
 
 
-@mock.patch.object(s3.S3, "connect")
-def test_list_files_in_folder(connect_mock):
+def test_list_files_in_folder(s3_mocked):
+    S3, client = s3_mocked
     url = "https://test_bucket.nyc3.digitaloceanspaces.com/test_bucket/"
-    S3 = s3.S3()
 
-    connect_mock.return_value.list_objects_v2.return_value = {
+    client.list_objects_v2.return_value = {
         "KeyCount": 0,
         "MaxKeys": "1000",
         "Contents": [{"Key": "test.csv", "Key": "test_2.csv"}],
@@ -43,7 +57,7 @@ def test_list_files_in_folder(connect_mock):
     obj_list = S3.list_files_in_folder(url)
     assert obj_list == []
 
-    connect_mock.return_value.list_objects_v2.return_value = {
+    client.list_objects_v2.return_value = {
         "KeyCount": 2,
         "MaxKeys": 2,
         "Contents": [{"Key": "test.csv"}, {"Key": "test_2.csv"}],
@@ -52,7 +66,7 @@ def test_list_files_in_folder(connect_mock):
     assert obj_list == ["test.csv", "test_2.csv"]
 
     url = "https://test_bucket.nyc3.digitaloceanspaces.com/test_bucket"
-    connect_mock.return_value.list_objects_v2.return_value = {
+    client.list_objects_v2.return_value = {
         "KeyCount": 2,
         "MaxKeys": 2,
         "Contents": [{"Key": "test.csv"}, {"Key": "test_2.csv"}],
@@ -69,13 +83,95 @@ def test_connect(check_mocker, session_mocker_1, session_mocker_2):
     S3.connect()
 
 
-@mock.patch.object(s3.S3, "connect")
-def test_upload_to_s3(connect_mock):
-    connect_mock.return_value.upload_file.return_value = None
+def test_upload_to_s3(s3_mocked):
+    S3, client = s3_mocked
+    client.upload_file.return_value = None
     url = "https://walden.nyc3.digitaloceanspaces.com/a/test.csv"
-    S3 = s3.S3()
     s3_path = S3.upload_to_s3(s3_path=url, local_path="test.csv", public=True)
     assert url == s3_path
 
     s3_path = S3.upload_to_s3(s3_path=url, local_path="test.csv", public=False)
     assert url.replace("https", "s3") == s3_path
+
+
+def _mock_download_fileobj(bucket_name, s3_file, fileobj):
+    fileobj.write(b"test")
+
+
+@fixture
+def empty_s3_cache():
+    # Do not reuse (or leave behind for other tests) any S3 object cached by module-level functions.
+    s3._get_s3.cache_clear()
+    yield
+    s3._get_s3.cache_clear()
+
+
+@mark.usefixtures("empty_s3_cache")
+@mock.patch.object(s3.S3, "connect")
+def test_obj_from_s3_reuses_connection(connect_mock):
+    connect_mock.return_value.download_fileobj.side_effect = _mock_download_fileobj
+    assert s3.obj_from_s3("s3://walden/a/test.txt") == "test"
+    assert s3.obj_from_s3("s3://walden/a/test.txt") == "test"
+    assert connect_mock.call_count == 1
+
+
+def test_obj_to_s3_and_obj_from_s3_in_memory(s3_mocked):
+    S3, client = s3_mocked
+    uploaded = {}
+
+    def _upload_fileobj(fileobj, bucket_name, s3_file, ExtraArgs):
+        uploaded[(bucket_name, s3_file)] = fileobj.read()
+
+    def _download_fileobj(bucket_name, s3_file, fileobj):
+        fileobj.write(uploaded[(bucket_name, s3_file)])
+
+    client.upload_fileobj.side_effect = _upload_fileobj
+    client.download_fileobj.side_effect = _download_fileobj
+
+    df = pd.DataFrame({"a": [1, 2], "b": ["x", "y"]})
+    for s3_path, obj in [
+        ("s3://walden/a/test.json", {"a": [1, 2]}),
+        ("s3://walden/a/test.txt", "test"),
+        ("s3://walden/a/test.csv", df),
+        ("s3://walden/a/test.xlsx", df),
+        ("s3://walden/a/test.parquet", df),
+        ("s3://walden/a/test.feather", df),
+    ]:
+        S3.obj_to_s3(obj, s3_path)
+        recovered = S3.obj_from_s3(s3_path)
+        if isinstance(obj, pd.DataFrame):
+            assert recovered.equals(obj)
+        else:
+            assert recovered == obj
+    assert client.upload_file.call_count == 0
+    assert client.download_file.call_count == 0
+
+
+def test_check_for_aws_profile(tmp_path, monkeypatch):
+    config_file = tmp_path / "config"
+    monkeypatch.setattr(s3.path, "expanduser", lambda _: str(config_file))
+    with raises(s3.ConfigurationError):
+        s3.check_for_aws_profile("default")
+    config_file.write_text("[default]\naws_access_key_id = ...\n")
+    s3.check_for_aws_profile("default")
+    with raises(s3.ConfigurationError):
+        s3.check_for_aws_profile("other")
+    # A change in the file is detected.
+    config_file.write_text("[default]\n\n[other]\n")
+    os.utime(config_file, ns=(0, 1))
+    s3.check_for_aws_profile("other")
+    # For backwards compatibility, ConfigurationError is also a FileExistsError.
+    with raises(FileExistsError):
+        s3.check_for_aws_profile("missing")
+
+
+@mock.patch.object(s3, "EXCEL_READ_ENGINE", "calamine")
+@mock.patch.object(s3.pd, "read_excel")
+def test_obj_from_s3_uses_excel_read_engine(read_excel_mock, s3_mocked):
+    S3, _ = s3_mocked
+    for extension in ["xls", "xlsx", "xlsb"]:
+        S3.obj_from_s3(f"s3://walden/a/test.{extension}")
+        assert read_excel_mock.call_args.kwargs == {"engine": "calamine"}
+    # An explicitly given engine is respected.
+    S3.obj_from_s3("s3://walden/a/test.xlsx", engine="openpyxl")
+    assert read_excel_mock.call_args.kwargs == {"engine": "openpyxl"}
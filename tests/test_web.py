@@ -3,11 +3,19 @@
 """
 
 
-from pytest import warns
+from pytest import fixture, mark, warns
 from unittest import mock
 
 from owid.datautils.io.json import load_json
-from owid.datautils.web import download_file_from_url, get_base_url
+import pandas as pd
+
+from owid.datautils import get_base_url
+from owid.datautils.web import (
+    _split_scheme_and_netloc,
+    download_file_from_url,
+    get_base_urls,
+    reset_base_url_warnings,
+)
 from .mocks import MockResponse
 
 
@@ -19,64 +27,142 @@ MOCK_RESPONSE_2 = {"new_key": "new_value"}
 MOCK_WRONG_URL = "http://wrong_owid_url.com/wrong_test.json"
 
 
+@fixture
+def empty_url_cache():
+    # Start with an empty cache of parsed urls, so that the first call of each test is not a cache hit, and with no
+    # base urls already warned about (which would silence warnings when using dedupe_warnings).
+    _split_scheme_and_netloc.cache_clear()
+    reset_base_url_warnings()
+
+
+@mark.no_io
+@mark.usefixtures("empty_url_cache")
 class TestGetBaseUrl:
-    def test_on_correct_urls_returning_scheme(self):
-        # With http.
-        assert get_base_url("http://example.com") == "http://example.com"
-        assert get_base_url("http://example.com/some/path") == "http://example.com"
-        assert (
-            get_base_url("http://example.com.au/some/path") == "http://example.com.au"
-        )
-        # With https.
-        assert get_base_url("https://example.com") == "https://example.com"
-        assert get_base_url("https://example.com/some/path") == "https://example.com"
-        assert (
-            get_base_url("https://example.com.au/some/path") == "https://example.com.au"
-        )
-
-    def test_on_correct_urls_without_returning_scheme(self):
-        # With http.
-        assert get_base_url("http://example.com", include_scheme=False) == "example.com"
-        assert (
-            get_base_url("http://example.com/some/path", include_scheme=False)
-            == "example.com"
-        )
-        assert (
-            get_base_url("http://example.com.au/some/path", include_scheme=False)
-            == "example.com.au"
-        )
-        # With https.
-        assert (
-            get_base_url("https://example.com", include_scheme=False) == "example.com"
-        )
-        assert (
-            get_base_url("https://example.com/some/path", include_scheme=False)
-            == "example.com"
-        )
-        assert (
-            get_base_url("https://example.com.au/some/path", include_scheme=False)
-            == "example.com.au"
-        )
-
-    def test_on_urls_without_scheme_returning_scheme(self):
-        with warns(UserWarning):
-            assert get_base_url("example.com") == "http://example.com"
-            assert get_base_url("example.com/some/path") == "http://example.com"
-            assert get_base_url("example.com.au/some/path") == "http://example.com.au"
-            assert get_base_url("bad_url") == "http://bad_url"
-
-    def test_on_urls_without_scheme_without_returning_scheme(self):
-        with warns(UserWarning):
-            assert get_base_url("example.com", include_scheme=False) == "example.com"
-            assert (
-                get_base_url("example.com/some/path", include_scheme=False)
-                == "example.com"
-            )
-            assert (
-                get_base_url("example.com.au/some/path", include_scheme=False)
-                == "example.com.au"
+    @mark.parametrize(
+        "url, include_scheme, expected",
+        [
+            # With http.
+            ("http://example.com", True, "http://example.com"),
+            ("http://example.com/some/path", True, "http://example.com"),
+            ("http://example.com.au/some/path", True, "http://example.com.au"),
+            ("http://example.com", False, "example.com"),
+            ("http://example.com/some/path", False, "example.com"),
+            ("http://example.com.au/some/path", False, "example.com.au"),
+            # With https.
+            ("https://example.com", True, "https://example.com"),
+            ("https://example.com/some/path", True, "https://example.com"),
+            ("https://example.com.au/some/path", True, "https://example.com.au"),
+            ("https://example.com", False, "example.com"),
+            ("https://example.com/some/path", False, "example.com"),
+            ("https://example.com.au/some/path", False, "example.com.au"),
+            # With query, fragment, port or user info.
+            ("https://example.com?a=1", True, "https://example.com"),
+            ("https://example.com#section", True, "https://example.com"),
+            ("https://example.com:8080/path?a=/b#c", True, "https://example.com:8080"),
+            ("https://user@example.com/path", False, "user@example.com"),
+        ],
+    )
+    def test_on_correct_urls(self, url, include_scheme, expected):
+        # The second call reuses the cached result of the first one.
+        for _ in range(2):
+            assert get_base_url(url, include_scheme=include_scheme) == expected
+        assert _split_scheme_and_netloc.cache_info().hits == 1
+
+    @mark.parametrize(
+        "url, include_scheme, expected",
+        [
+            ("example.com", True, "http://example.com"),
+            ("example.com/some/path", True, "http://example.com"),
+            ("example.com.au/some/path", True, "http://example.com.au"),
+            ("bad_url", True, "http://bad_url"),
+            ("example.com", False, "example.com"),
+            ("example.com/some/path", False, "example.com"),
+            ("example.com.au/some/path", False, "example.com.au"),
+            ("bad_url", False, "bad_url"),
+        ],
+    )
+    def test_on_urls_without_scheme(self, url, include_scheme, expected):
+        with warns(UserWarning, match="scheme not defined for"):
+            assert get_base_url(url, include_scheme=include_scheme) == expected
+
+    def test_on_repeated_urls_without_scheme_warning_every_time(self):
+        for _ in range(2):
+            with warns(UserWarning, match="scheme not defined for") as record:
+                assert get_base_url("repeated.example.com/path") == (
+                    "http://repeated.example.com"
+                )
+            assert len(record) == 1
+
+    def test_on_urls_without_scheme_deduplicating_warnings(self):
+        with warns(UserWarning, match="scheme not defined for") as record:
+            for path in ["", "/some/path", "/other/path"]:
+                assert (
+                    get_base_url(f"dedupe.example.com{path}", dedupe_warnings=True)
+                    == "http://dedupe.example.com"
+                )
+        assert len(record) == 1
+        # The warning points to the caller.
+        assert record[0].filename == __file__
+
+
+@mark.no_io
+class TestGetBaseUrls:
+    urls = [
+        "http://example.com",
+        "https://example.com.au/some/path",
+        "https://example.com?a=1#b",
+    ]
+    urls_without_scheme = ["example.com/some/path", "bad_url"]
+
+    def test_on_correct_urls(self):
+        for include_scheme in [True, False]:
+            base_urls = get_base_urls(
+                pd.Series(self.urls), include_scheme=include_scheme
             )
-            assert get_base_url("bad_url", include_scheme=False) == "bad_url"
+            assert base_urls.tolist() == [
+                get_base_url(url, include_scheme=include_scheme) for url in self.urls
+            ]
+
+    def test_on_urls_without_scheme(self):
+        urls = pd.Series(self.urls + self.urls_without_scheme)
+        for include_scheme in [True, False]:
+            with warns(UserWarning, match="scheme not defined for 2 urls") as record:
+                base_urls = get_base_urls(urls, include_scheme=include_scheme)
+            assert len(record) == 1
+            with warns(UserWarning, match="scheme not defined for"):
+                expected = [
+                    get_base_url(url, include_scheme=include_scheme) for url in urls
+                ]
+            assert base_urls.tolist() == expected
+
+    def test_on_lists_of_urls(self):
+        for include_scheme in [True, False]:
+            base_urls = get_base_urls(self.urls, include_scheme=include_scheme)
+            assert base_urls == [
+                get_base_url(url, include_scheme=include_scheme) for url in self.urls
+            ]
+
+    def test_on_iterables_of_urls_without_scheme(self):
+        urls = self.urls + self.urls_without_scheme
+        with warns(UserWarning, match="scheme not defined for 2 urls") as record:
+            base_urls = get_base_urls(iter(urls), include_scheme=False)
+        assert len(record) == 1
+        assert record[0].filename == __file__
+        assert base_urls == [
+            "example.com",
+            "example.com.au",
+            "example.com",
+            "example.com",
+            "bad_url",
+        ]
+
+    def test_keeps_index_and_missing_values(self):
+        urls = pd.Series(["https://example.com/path", None], index=[3, 5], name="url")
+        base_urls = get_base_urls(urls)
+        assert base_urls.index.tolist() == [3, 5]
+        assert base_urls.name == "url"
+        assert base_urls[3] == "https://example.com"
+        assert pd.isnull(base_urls[5])
 
 
 # Mock function to replace requests.get.